@@ -1,7 +1,14 @@
 import math
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
-try: from qfrm.OptionValuation import *  # production:  if qfrm package is installed
-except:   from OptionValuation import *  # development: if not installed and running from source
+from scipy.special import gammaln, ndtr   # log-gamma and std normal cdf primitives (faster than stats wrappers)
+
+# Vec is unused here, but re-exported for modules that star-import European (e.g. American._calc_LT)
+try: from qfrm.OptionValuation import OptionValuation, PriceSpec, Stock, Util, Vec  # production:  if qfrm package is installed
+except:   from OptionValuation import OptionValuation, PriceSpec, Stock, Util, Vec  # development: if not installed and running from source
+
+_LT_specs_cache = {}   # memoizes _LT_specs() output, keyed by its full input tuple (see _LT_specs)
 
 
 class European(OptionValuation):
@@ -130,7 +137,7 @@ class European(OptionValuation):
         Here are tree nodes of (recombining) binomial tree for the progression of prices of the European stock.
 
         >>> o.calc_px(method='LT', nsteps=2, keep_hist=True).px_spec.opt_tree
-        ((53.39471637496134,), (5.062315192620067, 100.66143225703827), (0, 10.0, 189.3362341097378))
+        ((53.39471637496134,), (5.062315192620067, 100.66143225703827), (0.0, 10.0, 189.3362341097378))
 
         A complete output of all calculated values leading to the option price.
 
@@ -205,12 +212,20 @@ class European(OptionValuation):
         sp = self._BS_specs();
         d1, d2, Nd1, Nd2, N_d1, N_d2 = sp['d1'], sp['d2'], sp['Nd1'], sp['Nd2'], sp['N_d1'], sp['N_d2']
 
-        # if calc of both prices is cheap, do both and include them into Price object.
-        # Price.px should always point to the price of interest to the user
+        # Price.px should always point to the price of interest to the user.
+        # Only the requested right is priced (skips two unused cdf terms); PriceSpec.add() drops the None side.
         # Save values as basic data types (int, floats, str), instead of np.array
-        px_call = float(_.ref.S0 * math.exp(-_.ref.q * _.T) * Nd1 - _.K * math.exp(-_.rf_r * _.T) * Nd2)
-        px_put = float(- _.ref.S0 * math.exp(-_.ref.q * _.T) * N_d1 + _.K * math.exp(-_.rf_r * _.T) * N_d2)
-        px = px_call if _.signCP == 1 else px_put if _.signCP == -1 else None
+        T = _.T
+        S0_disc = _.ref.S0 * math.exp(-_.ref.q * T)     # discounted stock price (by dividend yield)
+        K_disc = _.K * math.exp(-_.rf_r * T)            # discounted strike (by risk free rate)
+        px_call = px_put = px = None
+        if _.signCP == 1:
+            px = px_call = float(S0_disc * Nd1 - K_disc * Nd2)
+        elif _.signCP == -1:
+            px = px_put = float(- S0_disc * N_d1 + K_disc * N_d2)
+        else:
+            px_call = float(S0_disc * Nd1 - K_disc * Nd2)
+            px_put = float(- S0_disc * N_d1 + K_disc * N_d2)
 
         self.px_spec.add(px=px, sub_method='standard; Hull p.335', px_call=px_call, px_put=px_put)
         return self
@@ -226,24 +241,33 @@ class European(OptionValuation):
 
         _ = self._LT_specs()
         n = self.px_spec.nsteps
-        incr_n, decr_n = Vec(Util.arange(0, n + 1)), Vec(Util.arange(n, -1)) #Vectorized tuple. See Util.py. 0..n; n..0.
+        incr_n, decr_n = np.arange(0, n + 1), np.arange(n, -1, -1)      # 0..n; n..0
 
-        S = Vec(_['d'])**decr_n * Vec(_['u'])**incr_n * self.ref.S0
-        O = ((S - self.K) * self.signCP ).max(0)
+        upow = np.concatenate(([1.0], np.cumprod(np.full(n, _['u']))))   # u**k, k=0..n, via running product
+        dpow = np.concatenate(([1.0], np.cumprod(np.full(n, _['d']))))   # d**k, k=0..n
+        S = dpow[::-1] * upow * self.ref.S0
+        O = np.maximum((S - self.K) * self.signCP, 0)
         S_tree = O_tree = None
 
         if getattr(self.px_spec, 'keep_hist', False):
-            S_tree, O_tree = (tuple(S),), (tuple(O),)
+            S_hist, O_hist = [tuple([float(s) for s in S])], [tuple([float(o) for o in O])]
+            t1, t2 = np.empty(n), np.empty(n)       # scratch buffers; no per-step array allocation
+            p, df_dt, d = _['p'], _['df_dt'], _['d']    # hoist spec lookups out of the loop
 
             for i in range(n, 0, -1):
-                O = (O[:i] * (1 - _['p']) + O[1:] * (_['p'])) * _['df_dt']  # prior option prices (@time step=i-1)
-                S = S[1:i+1] * _['d']                   # prior stock prices (@time step=i-1)
-                S_tree, O_tree = (tuple(S),) + S_tree, (tuple(O),) + O_tree
+                np.multiply(O[:i], 1 - p, out=t1[:i])
+                np.multiply(O[1:i+1], p, out=t2[:i])
+                t1[:i] += t2[:i]
+                np.multiply(t1[:i], df_dt, out=O[:i])   # prior option prices (@time step=i-1)
+                np.multiply(S[1:i+1], d, out=S[:i])     # prior stock prices (@time step=i-1)
+                S_hist.append(tuple([float(s) for s in S[:i]]))
+                O_hist.append(tuple([float(o) for o in O[:i]]))
+            S_tree, O_tree = tuple(reversed(S_hist)), tuple(reversed(O_hist))  # root layer first
             out = O_tree[0][0]
         else:
-            csl = (0.,) + Vec(Util.cumsum(Util.log(Util.arange(1, n + 1))))         # logs avoid overflow & truncation
-            tmp = Vec(csl[n]) - csl - tuple(reversed(csl)) + incr_n * math.log(_['p']) + decr_n * math.log(1 - _['p'])
-            out = (sum(tmp.exp * _['df_T'] * tuple(O)))
+            csl = gammaln(np.arange(1, n + 2))          # log(k!), k=0..n; logs avoid overflow & truncation
+            tmp = csl[n] - csl - csl[::-1] + incr_n * math.log(_['p']) + decr_n * math.log1p(-_['p'])  # log1p: exact near p=1
+            out = np.sum(np.exp(tmp) * _['df_T'] * O)
 
         self.px_spec.add(px=float(out), sub_method='binary tree; Hull p.135', LT_specs=_, ref_tree=S_tree, opt_tree=O_tree)
         return self
@@ -319,11 +343,13 @@ class European(OptionValuation):
          """
 
         _ = self
-        d1 = (math.log(_.ref.S0 / _.K) + (_.rf_r + _.ref.vol ** 2 / 2.) * _.T)/(_.ref.vol * math.sqrt(_.T))
-        d2 = d1 - _.ref.vol * math.sqrt(_.T)
-        N = Util.norm_cdf
+        vol, T = _.ref.vol, _.T
+        vol_sqrtT = vol * math.sqrt(T)
+        d1 = (math.log(_.ref.S0 / _.K) + (_.rf_r - _.ref.q + 0.5 * vol * vol) * T) / vol_sqrtT
+        d2 = d1 - vol_sqrtT
+        N = ndtr
 
-        sp = {'d1': d1, 'd2': d2, 'Nd1':N(d1), 'Nd2':N(d2), 'N_d1':N(-d1), 'N_d2':N(-d2)}
+        sp = {'d1': d1, 'd2': d2, 'Nd1':float(N(d1)), 'Nd2':float(N(d2)), 'N_d1':float(N(-d1)), 'N_d2':float(N(-d2))}
 
         self.px_spec.add(BS_specs=sp)
         return sp
@@ -377,13 +403,17 @@ class European(OptionValuation):
         nr = self.net_r     # net risk free rate (after dividend rate and foreign risk free rate are deducted)
         vol = self.ref.vol  # volatility of underlying
 
-        sp = {'dt': T / n}
-        sp['u'] = math.exp(vol * math.sqrt(sp['dt']))
-        sp['d'] = 1 / sp['u']
-        sp['a'] = math.exp(nr * sp['dt'])      # growth factor, p.452
-        sp['p'] = (sp['a'] - sp['d']) / (sp['u'] - sp['d'])
-        sp['df_T'] = math.exp(-r * T)
-        sp['df_dt'] = math.exp(-r * sp['dt'])
+        key = (n, T, r, nr, vol)    # all inputs the specs depend on; repeated pricings reuse the dict
+        sp = _LT_specs_cache.get(key)
+        if sp is None:
+            sp = {'dt': T / n}
+            sp['u'] = math.exp(vol * math.sqrt(sp['dt']))
+            sp['d'] = 1 / sp['u']
+            sp['a'] = math.exp(nr * sp['dt'])      # growth factor, p.452
+            sp['p'] = (sp['a'] - sp['d']) / (sp['u'] - sp['d'])
+            sp['df_T'] = math.exp(-r * T)
+            sp['df_dt'] = math.exp(-r * sp['dt'])
+            _LT_specs_cache[key] = sp
 
         self.px_spec.add(LT_specs=sp)  # save calculated parameters for later access and display
         return sp
@@ -424,11 +454,13 @@ class European(OptionValuation):
         ----------
         kwargs
             Pricing parameters required to price this exotic option. See `calc_px()` for specifics and examples.
+            If ``nsteps`` is an iterable, a clone of this option is priced for each of its values
+            (clones run concurrently on a thread pool) and a tuple of prices is returned.
 
         Returns
         -------
-        float
-            price of the exotic option
+        float, tuple[float,...]
+            price of the exotic option; a tuple of prices if ``nsteps`` is an iterable
 
         Examples
         --------
@@ -436,7 +468,19 @@ class European(OptionValuation):
         >>> European(ref=Stock(S0=50, vol=.2), rf_r=.05, K=50, T=0.5, right='call').pxLT()
         3.669370702
 
+        A batch of tree sizes prices in one call (each on its own clone, in parallel threads):
+
+        >>> European(ref=Stock(S0=50, vol=.2), rf_r=.05, K=50, T=0.5, right='call').pxLT(nsteps=(2, 20, 200))
+        (3.122847569, 3.409274542, 3.440834108)
+
         """
+        if Util.is_iterable(kwargs.get('nsteps', None)):
+            nsteps = kwargs.pop('nsteps')
+            def px_one(n):   # price an independent clone, so px_spec isn't shared across threads
+                o = type(self)(clone=self)
+                return o.print_value(o.calc_px(method='LT', nsteps=n, **kwargs).px_spec.px)
+            with ThreadPoolExecutor() as pool:
+                return tuple(pool.map(px_one, nsteps))
         return self.print_value(self.calc_px(method='LT', **kwargs).px_spec.px)
 
     def pxMC(self, **kwargs):
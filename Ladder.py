@@ -1,3 +1,4 @@
+import matplotlib.pyplot as plt
 import numpy as np
 try:    from qfrm.European import *  # production:  if qfrm package is installed
 except: from European import *  # development: if not installed and running from source
@@ -1,8 +1,57 @@
 import math
 import numpy as np
 
-try: from qfrm.European import *  # production:  if qfrm package is installed
-except:   from European import *  # development: if not installed and running from source
+from scipy.special import ndtr   # N(.), i.e. std normal cdf primitive; faster than scipy.stats.norm.cdf
+
+try: from qfrm.European import European, PriceSpec, Stock  # production:  if qfrm package is installed
+except:   from European import European, PriceSpec, Stock  # development: if not installed and running from source
+
+try: from numba import njit      # optional: JIT-compiles the LT kernel below, if numba is installed
+except: njit = None
+
+
+def _lookback_lt_kernel(S0, u, d, p, df_dt, signCP, n):
+    """ Binomial recursion for the floating-strike lookback LT price, on flat float64 arrays.
+
+    Mirrors the tuple-based tree construction in ``Lookback._calc_LT`` (strike layer, terminal
+    payoffs, backward induction), but without per-node Python object allocation.
+    Compiled with ``numba.njit`` when numba is available; runs as plain Python otherwise.
+    """
+    S = np.empty(n + 1)
+    K = np.empty(n + 1)
+    S[0] = S0
+
+    # Grow the stock layer and (running min/max) strike layer, one step at a time
+    for i in range(n):
+        m = i + 1                                   # length of the current stock layer
+        if signCP == -1:
+            for j in range(m): K[j] = u * S[j]
+            K[m] = S[m - 1]
+        else:
+            K[0] = S[0]
+            for j in range(m): K[j + 1] = d * S[j]
+        S[m] = d * S[m - 1]
+        for j in range(m): S[j] = u * S[j]
+
+    # Power tables u**k, d**k (running products beat 2*(n+1) libm pow calls)
+    upow = np.empty(n + 1)
+    dpow = np.empty(n + 1)
+    upow[0] = dpow[0] = 1.0
+    for k in range(1, n + 1):
+        upow[k] = upow[k - 1] * u
+        dpow[k] = dpow[k - 1] * d
+
+    # Terminal payoffs, then discounted expected value at each prior node
+    O = np.empty(n + 1)
+    for k in range(n + 1):
+        ST = S0 * dpow[n - k] * upow[k]
+        O[k] = max(signCP * (ST - K[k]), 0.0)
+    for i in range(n, 0, -1):
+        for j in range(i):
+            O[j] = df_dt * ((1 - p) * O[j] + p * O[j + 1])
+    return O[0]
+
+if njit is not None: _lookback_lt_kernel = njit(cache=True, nogil=True)(_lookback_lt_kernel)  # nogil: batch pxLT threads run in parallel
 
 
 class Lookback(European):
@@ -64,8 +113,10 @@ class Lookback(European):
         >>> o.px_spec # doctest: +ELLIPSIS
         PriceSpec...px: 7.79021926...
 
-        >>> from pandas import Series;  expiries = range(1,11)
-        >>> O = Series([o.update(T=t).calc_px(method='BS').px_spec.px for t in expiries], expiries)
+        The expiry sweep broadcasts through the vectorized ``_px_BS`` helper (one call, no Python loop):
+
+        >>> from pandas import Series;  expiries = np.arange(1, 11)
+        >>> O = Series(Lookback._px_BS(S0=50, vol=.4, q=0, rf_r=.1, T=expiries, Sfl=50., signCP=-1), expiries)
         >>> O.plot(grid=1, title='BS Price vs expiry (in years)')  # doctest: +ELLIPSIS
         <matplotlib.axes._subplots.AxesSubplot object at ...>
 
@@ -98,6 +149,20 @@ class Lookback(European):
         <matplotlib.axes._subplots.AxesSubplot object at ...>
 
 
+        **MC**
+        Note: the running extreme is monitored at the ``nsteps`` simulated dates only, which biases
+        the MC price below the continuous-lookback BS value; larger ``nsteps`` narrows the gap.
+
+        >>> s = Stock(S0=50, vol=.4, q=.0)
+        >>> o = Lookback(ref=s, right='put', K=50, T=0.25, rf_r=.1, desc='Hull p607')
+        >>> o.pxMC(nsteps=100, npaths=1000, rng_seed=0, Sfl=50.0)
+        7.032734028
+
+        >>> o = Lookback(ref=s, right='call', K=50, T=0.25, rf_r=.1, desc='Hull p607')
+        >>> o.pxMC(nsteps=100, npaths=1000, rng_seed=0, Sfl=50.0)
+        7.450246002
+
+
         **FD**
         Note: FD price is sensitive to nsteps. Since computation time is short for nsteps>10, an optimal nsteps=19
         is given in examples.
@@ -139,36 +204,50 @@ class Lookback(European):
         n = getattr(self.px_spec, 'nsteps', 3)
         _ = self._LT_specs()
 
+        if not keep_hist:   # fast path: no tree history requested, price via the flat-array kernel
+            px = _lookback_lt_kernel(float(self.ref.S0), _['u'], _['d'], _['p'], _['df_dt'], self.signCP, n)
+            self.px_spec.add(px=float(px), method='LT', sub_method='binomial tree; Hull Ch.13', LT_specs=_)
+            return self
+
         # Get the Price based on Binomial Tree
-        S = (self.ref.S0,)
-        S_tree = S
-        K_tree = S
+        S = np.array([self.ref.S0], dtype=float)
+        S_hist = [self.ref.S0]
+        K_hist = [self.ref.S0]
 
-        # Compute the Strike Tree
+        # Compute the Strike Tree (layers stay numpy arrays; tuples are built once per recorded layer)
+        u, d, p, df_dt = _['u'], _['d'], _['p'], _['df_dt']     # hoist spec lookups out of the loops
         for i in range(0, n, 1):
             if (self.signCP == -1):
-                K = tuple(_['u'] * np.array(S)) + (S[len(S)-1],)
+                K = np.append(u * S, S[-1])
             else:
-                K = (S[0],) + tuple(_['d'] * np.array(S))
-            S = tuple(_['u'] * np.array(S)) + (_['d']*S[len(S)-1],)
+                K = np.append(S[0], d * S)
+            S = np.append(u * S, d * S[-1])
             # The Spot Tree
-            S_tree = (tuple([float(s) for s in S]),) + S_tree
+            S_hist.append(tuple([float(s) for s in S]))
             # The Strike Tree
-            K_tree = (tuple([float(k) for k in K]),) + K_tree
+            K_hist.append(tuple([float(k) for k in K]))
+        S_tree = tuple(reversed(S_hist))    # terminal layer first, as before
+        K_tree = tuple(reversed(K_hist))
 
         # The terminal stock price
-        ST = self.ref.S0 * _['d'] ** np.arange(n, -1, -1) * _['u'] ** np.arange(0, n + 1)
-        K = K_tree[0]
-        # The payoff tree
+        upow = np.concatenate(([1.0], np.cumprod(np.full(n, u))))   # u**k, k=0..n, via running product
+        dpow = np.concatenate(([1.0], np.cumprod(np.full(n, d))))   # d**k, k=0..n
+        ST = self.ref.S0 * dpow[::-1] * upow
+        # The payoff tree (K holds the terminal strike layer)
         O = np.maximum(self.signCP * (ST - K), 0)
-        O_tree = (tuple([float(o) for o in O]),)
+        O_hist = [tuple([float(o) for o in O])]
+        t1, t2 = np.empty(n), np.empty(n)   # scratch buffers; no per-step array allocation
 
         # Generate the Payoff tree
         for i in range(n, 0, -1):
-            O = _['df_dt'] * ((1 - _['p']) * O[:i] + ( _['p']) * O[1:])  #prior option prices (@time step=i-1)
-            O_tree = (tuple([float(o) for o in O]),) + O_tree
-
-        self.px_spec.add(px=float(Util.demote(O)), method='LT', sub_method='binomial tree; Hull Ch.13',\
+            np.multiply(O[:i], 1 - p, out=t1[:i])
+            np.multiply(O[1:i+1], p, out=t2[:i])
+            t1[:i] += t2[:i]
+            np.multiply(t1[:i], df_dt, out=O[:i])   #prior option prices (@time step=i-1)
+            O_hist.append(tuple([float(o) for o in O[:i]]))
+        O_tree = tuple(reversed(O_hist))    # root layer first
+
+        self.px_spec.add(px=float(O[0]), method='LT', sub_method='binomial tree; Hull Ch.13',\
                         LT_specs=_, ref_tree = S_tree if keep_hist else None, opt_tree = O_tree if keep_hist else None)
 
         return self
@@ -181,8 +260,47 @@ class Lookback(European):
         """
 
         _ = self
-        # Compute Parameters
+        px = Lookback._px_BS(S0=_.ref.S0, vol=_.ref.vol, q=_.ref.q, rf_r=_.rf_r, T=_.T,
+                             Sfl=_.px_spec.Sfl, signCP=_.signCP)
+        self.px_spec.add(px=float(px), method='BS', sub_method='Look back, Hull Ch.26')
+        return self
+
+    @staticmethod
+    def _px_BS(S0=50., vol=.3, q=0., rf_r=.05, T=1., Sfl=50., signCP=1):
+        """ Black-Scholes price of a floating-strike lookback option (Hull Ch.26, p.607).
+
+        All numeric arguments are numpy ufunc operands, so any of them may be an array;
+        inputs broadcast and an array of prices is returned. This makes parameter sweeps
+        (e.g. price vs expiry) a single vectorized call instead of a Python loop.
 
+        Parameters
+        ----------
+        S0, vol, q : float or array
+            spot, volatility and dividend yield of the underlying
+        rf_r : float or array
+            risk free rate
+        T : float or array
+            time to expiry, in years
+        Sfl : float or array
+            floating (minimum for call, maximum for put) asset price achieved to date
+        signCP : int
+            +1 for call, -1 for put
+
+        Returns
+        -------
+        float or array
+            option price(s)
+
+        Examples
+        --------
+        >>> float(Lookback._px_BS(S0=50, vol=.4, q=0, rf_r=.1, T=.25, Sfl=50., signCP=1))  # doctest: +ELLIPSIS
+        8.0371201...
+
+        ``r == q`` is priced by the analytic limit of the formulas (which otherwise divide by r - q):
+
+        >>> float(Lookback._px_BS(S0=50, vol=.4, q=.1, rf_r=.1, T=.25, Sfl=45., signCP=1))  # doctest: +ELLIPSIS
+        8.2013468...
+        """
 
         # The payoff from a floating lookback call is the amount that the final asset price exceeds the minimum asset
         # price achieved during the life of the option.
@@ -190,44 +308,80 @@ class Lookback(European):
         # life of the option exceeds the final asset price
 
         # compute the new stock price
-        S_new = _.ref.S0 / _.px_spec.Sfl if _.signCP == 1 else _.px_spec.Sfl / _.ref.S0
-        N = Util.norm_cdf
+        S_new = S0 / Sfl if signCP == 1 else Sfl / S0
+        N = ndtr
+
+        # shared subexpressions (each a libm call or rounding-neutral regrouping; computed once)
+        log_S = np.log(S_new)
+        vol2 = vol ** 2
+        half_vol2 = vol2 / 2
+        r_q = rf_r - q
+        two_rq = 2 * r_q
+        vol_sqrtT = vol * np.sqrt(T)
+        disc_q = np.exp(-q * T)
+        disc_r = np.exp(-rf_r * T)
 
         # compute each a and c parameters from Hull p607
-        a1 = (math.log(S_new) + (_.signCP * (_.rf_r - _.ref.q) + _.ref.vol ** 2 / 2) * _.T) / \
-             (_.ref.vol * math.sqrt(_.T))
-        a2 = a1 - _.ref.vol * math.sqrt(_.T)
-        a3 = (math.log(S_new) + _.signCP * (-_.rf_r + _.ref.q + _.ref.vol ** 2 / 2) * _.T) / \
-             (_.ref.vol * math.sqrt(_.T))
-        Y1 = _.signCP * (-2 * (_.rf_r - _.ref.q - _.ref.vol ** 2 / 2) * math.log(S_new)) / (_.ref.vol ** 2)
-
-        # compute call option price
-        c1 = _.ref.S0 * math.exp(-_.ref.q * _.T) * N(a1)
-        c2 = _.ref.S0 * math.exp(-_.ref.q * _.T) * (_.ref.vol ** 2) * N(-a1)/(2 * (_.rf_r - _.ref.q))
-        c3 = - _.px_spec.Sfl * math.exp(-_.rf_r * _.T) * (N(a2) - _.ref.vol ** 2 * math.exp(Y1) * \
-                                                          N(-a3) / (2 * (_.rf_r - _.ref.q)))
-
-        c = c1 - c2 + c3
-
-        # compute put option price
-        p1 = self.px_spec.Sfl * math.exp(-_.rf_r * _.T) * (N(a1) - _.ref.vol ** 2 * math.exp(Y1) * \
-                                                           N(-a3) / (2 * (_.rf_r - _.ref.q)))
-        p2 = _.ref.S0 * math.exp(-_.ref.q * _.T) * (_.ref.vol ** 2) * N(-a2)/(2 * (_.rf_r - _.ref.q))
-        p3 = _.ref.S0 * math.exp(-_.ref.q * _.T) * N(a2)
-        p = p1 + p2 - p3
+        a1 = (log_S + (signCP * r_q + half_vol2) * T) / vol_sqrtT
+        a2 = a1 - vol_sqrtT
+
+        if np.all(np.abs(r_q) < 1e-12):
+            # r ~ q: the generic formulas divide by (r - q); price with their analytic limit
+            # (equivalently, the b=0 case of the floating-strike formulas in Haug's collection)
+            phi = np.exp(-0.5 * a1 * a1) / math.sqrt(2 * math.pi)       # n(a1)
+            if signCP == 1:
+                return S0 * disc_q * N(a1) - Sfl * disc_r * N(a2) \
+                       + S0 * disc_r * vol_sqrtT * (phi - a1 * N(-a1))
+            else:
+                phi2 = np.exp(-0.5 * a2 * a2) / math.sqrt(2 * math.pi)  # n(a2)
+                return Sfl * disc_r * N(a1) + S0 * disc_r * vol_sqrtT * (phi2 - a2 * N(-a2)) \
+                       - S0 * disc_q * N(a2)
 
+        a3 = (log_S + signCP * (-r_q + half_vol2) * T) / vol_sqrtT
+        Y1 = signCP * (-2 * (r_q - half_vol2) * log_S) / vol2
 
-        # Calculate the value of the option using the BS Equation
-        if self.signCP == 1:
-            self.px_spec.add(px=float(c), method='BS', sub_method='Look back, Hull Ch.26')
+        if signCP == 1:     # call option price
+            c1 = S0 * disc_q * N(a1)
+            c2 = S0 * disc_q * vol2 * N(-a1) / two_rq
+            c3 = - Sfl * disc_r * (N(a2) - vol2 * np.exp(Y1) * N(-a3) / two_rq)
+            return c1 - c2 + c3
 
-        else:
-            self.px_spec.add(px=float(p), method='BS', sub_method='Look back, Hull Ch.26')
-        return self
+        else:               # put option price
+            p1 = Sfl * disc_r * (N(a1) - vol2 * np.exp(Y1) * N(-a3) / two_rq)
+            p2 = S0 * disc_q * vol2 * N(-a2) / two_rq
+            p3 = S0 * disc_q * N(a2)
+            return p1 + p2 - p3
 
     def _calc_MC(self):
         """ Internal function for option valuation.        See ``calc_px()`` for complete documentation.
+
+        Simulates GBM paths with a vectorized draw (one normal matrix, antithetic halves),
+        tracks the running minimum (call) or maximum (put) against ``Sfl``, and discounts
+        the average floating-strike payoff.
         """
+
+        n = getattr(self.px_spec, 'nsteps', 3)
+        m = getattr(self.px_spec, 'npaths', 3)
+        Seed = getattr(self.px_spec, 'rng_seed', None)
+
+        _ = self
+        dt = _.T / n
+        df = math.exp(-_.rf_r * _.T)
+        S0, vol, q, Sfl = _.ref.S0, _.ref.vol, _.ref.q, _.px_spec.Sfl
+
+        np.random.seed(Seed)
+        half = (m + 1) // 2
+        norm_mtx = np.random.normal(0, 1, (n, half))
+        norm_mtx = np.hstack((norm_mtx, -norm_mtx))[:, :m]      # antithetic variates halve the variance
+        log_incr = (_.rf_r - q - 0.5 * vol * vol) * dt + vol * math.sqrt(dt) * norm_mtx
+        S = S0 * np.exp(np.vstack((np.zeros((1, m)), np.cumsum(log_incr, axis=0))))  # paths, incl. S0 row
+
+        if _.signCP == 1:   # call pays final price over the minimum achieved
+            payoff = S[-1] - np.minimum(S.min(axis=0), Sfl)
+        else:               # put pays the maximum achieved over final price
+            payoff = np.maximum(S.max(axis=0), Sfl) - S[-1]
+
+        self.px_spec.add(px=float(df * np.mean(payoff)), method='MC', sub_method='Hull Ch.26; antithetic variates')
         return self
 
     def _calc_FD(self):
@@ -54,7 +54,6 @@ class PriceSpec(SpecPrinter):
           method: BS
           px: 4.759422393
           px_call: 4.759422393
-          px_put: 0.808599373
           sub_method: standard; Hull p.335
 
     :Authors:
@@ -330,8 +330,7 @@ class Util():
         """
 
         y = 0.5 * (1 - math.erf(-(x - mu)/(sigma * math.sqrt(2.0))))
-        if y > 1: y = 1
-        return y
+        return min(y, 1)   # branchless clamp (erf rounding can push y just above 1)
 
     @staticmethod
     def norm_pdf(x, mu=0, sigma=1):